@@ -16,31 +16,67 @@ import os
 import sys
 import re
 import io
-import base64
+import csv
 import traceback
 import logging
 import asyncio
 import json
+import threading
+
+# Fast JSON serialization for the outbound web path (~2-3x json.dumps,
+# writes bytes directly)
+import orjson
+
+# uvloop is a drop-in libuv event loop, a well-known 2-4x throughput bump for
+# aiohttp services. Optional so local Windows development still works.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    uvloop = None
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Tuple
 from aiohttp import web
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 # Load environment variables from .env file (for local development)
 load_dotenv()
 
-# Azure Key Vault SDK
-from azure.identity import DefaultAzureCredential
-from azure.keyvault.secrets import SecretClient
+# Azure Key Vault SDK (async variants - secrets are fetched concurrently at startup)
+from azure.identity.aio import DefaultAzureCredential, ManagedIdentityCredential
+from azure.keyvault.secrets.aio import SecretClient
 
 # MSAL for OBO token exchange
 import msal
 
 # Chart generation
-import matplotlib
-matplotlib.use('Agg')  # Non-GUI backend for server-side rendering
-import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
+import numpy as np
+
+# matplotlib is imported lazily on first chart render - its import costs
+# seconds of cold-start CPU and RSS that web-only requests never need.
+# The pyplot state machine is skipped entirely: charts render through the
+# object-oriented Figure/FigureCanvasAgg API.
+Figure = None
+FigureCanvasAgg = None
+ticker = None
+
+
+def _load_matplotlib():
+    """Import matplotlib on first use and memoize at module scope."""
+    global Figure, FigureCanvasAgg, ticker
+    if Figure is None:
+        import matplotlib
+        matplotlib.use('Agg')  # Non-GUI backend for server-side rendering
+        from matplotlib.figure import Figure as _Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg as _FigureCanvasAgg
+        import matplotlib.ticker as _ticker
+        Figure = _Figure
+        FigureCanvasAgg = _FigureCanvasAgg
+        ticker = _ticker
 
 # Configure logging
 logging.basicConfig(
@@ -56,12 +92,19 @@ from botbuilder.core import (
     BotFrameworkAdapter,
     TurnContext,
     MemoryStorage,
+    UserTokenClient,
 )
 # TeamsSSOTokenExchangeMiddleware removed - requires Azure Bot OAuth connection
-from botbuilder.schema import Activity, ActivityTypes, Attachment, InvokeResponse
+from botbuilder.schema import (
+    Activity,
+    ActivityTypes,
+    Attachment,
+    CardAction,
+    InvokeResponse,
+    OAuthCard,
+)
 
-# Databricks SDK
-from databricks.sdk import WorkspaceClient
+# Databricks SDK (WorkspaceClient) is imported lazily inside GenieClient
 
 # =============================================================================
 # Configuration from Azure Key Vault
@@ -70,22 +113,98 @@ from databricks.sdk import WorkspaceClient
 # Key Vault URL (must be set via environment variable or .env file)
 KEY_VAULT_URL = os.getenv("KEY_VAULT_URL", "")
 
+# Secret names in Key Vault, in assignment order
+SECRET_NAMES = [
+    "microsoft-app-id",
+    "microsoft-app-password",
+    "microsoft-app-tenant-id",
+    "databricks-host",
+    "databricks-client-id",
+    "databricks-client-secret",
+    "genie-space-id",
+]
+
+
+# Local secrets cache - avoids re-fetching from Key Vault on warm restarts.
+# /home/site is persistent storage on Azure App Service.
+SECRETS_CACHE_PATH = os.getenv("SECRETS_CACHE_PATH", "/home/site/.secrets_cache.json")
+SECRETS_CACHE_TTL_SECONDS = 24 * 3600
+
+
+def _read_secrets_cache() -> Optional[List[str]]:
+    """Read cached secrets from disk. Returns None on miss, expiry, or any error."""
+    try:
+        with open(SECRETS_CACHE_PATH, "r") as f:
+            cached = json.load(f)
+        if cached.get("expires_at", 0) < datetime.now().timestamp():
+            logger.info("Secrets cache expired, will re-fetch from Key Vault")
+            return None
+        values = cached.get("secrets", {})
+        if not all(name in values for name in SECRET_NAMES):
+            return None
+        logger.info("Loaded secrets from local cache (skipping Key Vault)")
+        return [values[name] for name in SECRET_NAMES]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Could not read secrets cache: {e}")
+        return None
+
+
+def _write_secrets_cache(values: List[str]):
+    """Persist secrets to disk with an expiry timestamp. Best-effort only."""
+    try:
+        payload = {
+            "expires_at": datetime.now().timestamp() + SECRETS_CACHE_TTL_SECONDS,
+            "secrets": dict(zip(SECRET_NAMES, values)),
+        }
+        with open(SECRETS_CACHE_PATH, "w") as f:
+            json.dump(payload, f)
+        os.chmod(SECRETS_CACHE_PATH, 0o600)
+        logger.info(f"Secrets cached to {SECRETS_CACHE_PATH}")
+    except Exception as e:
+        logger.warning(f"Could not write secrets cache: {e}")
+
+
+async def _load_secrets() -> List[str]:
+    """Fetch all secrets from Key Vault concurrently (one round-trip instead of seven)."""
+    # On App Service, go straight to managed identity - DefaultAzureCredential
+    # probes 6+ credential sources with a failing network/subprocess call each
+    # before reaching it. Local development keeps the full chain.
+    if os.getenv("WEBSITE_INSTANCE_ID"):
+        credential = ManagedIdentityCredential()
+    else:
+        credential = DefaultAzureCredential()
+    secret_client = SecretClient(vault_url=KEY_VAULT_URL, credential=credential)
+    try:
+        secrets = await asyncio.gather(
+            *(secret_client.get_secret(name) for name in SECRET_NAMES)
+        )
+        return [secret.value for secret in secrets]
+    finally:
+        await secret_client.close()
+        await credential.close()
+
+
 # Initialize credentials
 logger.info(f"Connecting to Key Vault: {KEY_VAULT_URL}")
 try:
-    credential = DefaultAzureCredential()
-    secret_client = SecretClient(vault_url=KEY_VAULT_URL, credential=credential)
-    
-    # Retrieve secrets from Key Vault
-    APP_ID = secret_client.get_secret("microsoft-app-id").value
-    APP_PASSWORD = secret_client.get_secret("microsoft-app-password").value
-    APP_TENANT_ID = secret_client.get_secret("microsoft-app-tenant-id").value
-    DATABRICKS_HOST = secret_client.get_secret("databricks-host").value
-    DATABRICKS_CLIENT_ID = secret_client.get_secret("databricks-client-id").value
-    DATABRICKS_CLIENT_SECRET = secret_client.get_secret("databricks-client-secret").value
-    GENIE_SPACE_ID = secret_client.get_secret("genie-space-id").value
-    
-    logger.info("Successfully retrieved all secrets from Key Vault")
+    # Check the local cache first, then fall back to Key Vault
+    _secret_values = _read_secrets_cache()
+    if _secret_values is None:
+        _secret_values = asyncio.run(_load_secrets())
+        _write_secrets_cache(_secret_values)
+    (
+        APP_ID,
+        APP_PASSWORD,
+        APP_TENANT_ID,
+        DATABRICKS_HOST,
+        DATABRICKS_CLIENT_ID,
+        DATABRICKS_CLIENT_SECRET,
+        GENIE_SPACE_ID,
+    ) = _secret_values
+
+    logger.info("Successfully retrieved all secrets")
 except Exception as e:
     logger.error(f"Failed to retrieve secrets from Key Vault: {e}")
     # Fallback to environment variables for local testing
@@ -103,6 +222,11 @@ PORT = int(os.getenv("PORT", os.getenv("WEBSITES_PORT", "8000")))
 # Bot public URL - Azure App Service URL (must be set via environment variable or .env file)
 BOT_PUBLIC_URL = os.getenv("BOT_PUBLIC_URL", "")
 
+# Render charts client-side with native Adaptive Card Chart elements instead of
+# server-side matplotlib PNGs. Matplotlib remains the fallback when disabled or
+# when a chart type has no native equivalent.
+USE_NATIVE_CHARTS = os.getenv("USE_NATIVE_CHARTS", "true").lower() in ("true", "1", "yes")
+
 # Single-tenant OAuth endpoint
 OAUTH_ENDPOINT = f"https://login.microsoftonline.com/{APP_TENANT_ID}" if APP_TENANT_ID else ""
 
@@ -136,13 +260,22 @@ logger.info("Using simple OAuth flow (no SSO middleware)")
 # User Token Manager - OBO Token Exchange
 # =============================================================================
 
+# Persistent OBO token cache - survives App Service restarts/recycles so workers
+# don't re-run the AAD exchange (~hundreds of ms) for every active user.
+TOKEN_CACHE_PATH = os.getenv("TOKEN_CACHE_PATH", "/home/site/.obo_token_cache.json")
+
+# Small dedicated pool for blocking MSAL calls - keeps slow AAD round-trips
+# from queueing behind unrelated work on the loop's default executor
+AUTH_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="obo")
+
+
 class UserTokenManager:
     """Manages user token acquisition and OBO exchange for Databricks."""
-    
+
     def __init__(self, app_id: str, app_password: str, tenant_id: str):
         """
         Initialize the token manager.
-        
+
         Args:
             app_id: Azure AD App ID
             app_password: Azure AD App Password/Secret
@@ -150,58 +283,127 @@ class UserTokenManager:
         """
         self.app_id = app_id
         self.tenant_id = tenant_id
+        # Dedicated MSAL cache we can reset - we keep our own user_id-keyed
+        # cache, so MSAL's internal account/RT store would only grow O(users)
+        # and slow down its cache scan on every OBO call.
+        self._msal_cache = msal.SerializableTokenCache()
         self.msal_app = msal.ConfidentialClientApplication(
             client_id=app_id,
             client_credential=app_password,
-            authority=f"https://login.microsoftonline.com/{tenant_id}"
+            authority=f"https://login.microsoftonline.com/{tenant_id}",
+            token_cache=self._msal_cache
         )
-        # Cache: user_id -> {token, expires_at}
-        self.user_tokens: Dict[str, Dict[str, Any]] = {}
-        logger.info("UserTokenManager initialized")
-    
-    def exchange_for_databricks_token(self, user_id: str, user_token: str) -> Optional[str]:
+        # Cache: user_id -> {token, expires_at}. TTLCache bounds memory under
+        # multi-tenant load (the old dict grew O(users) and never evicted);
+        # the explicit expires_at check still guards the real token lifetime.
+        self.user_tokens: TTLCache = TTLCache(maxsize=10_000, ttl=3500)
+        self.user_tokens.update(self._load_token_cache())
+        # In-flight OBO exchanges: user_id -> Future. Concurrent messages from
+        # the same user await one AAD round-trip instead of each making their own.
+        self._inflight: Dict[str, asyncio.Future] = {}
+        logger.info(f"UserTokenManager initialized ({len(self.user_tokens)} cached tokens loaded)")
+
+    def _load_token_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load previously exchanged tokens from disk, dropping expired entries."""
+        try:
+            with open(TOKEN_CACHE_PATH, "r") as f:
+                cached = json.load(f)
+            now = datetime.now().timestamp()
+            return {
+                user_id: entry for user_id, entry in cached.items()
+                if entry.get('expires_at', 0) > now
+            }
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Could not read OBO token cache: {e}")
+            return {}
+
+    def _persist_token_cache(self):
+        """Write the token cache to persistent storage. Best-effort only."""
+        try:
+            with open(TOKEN_CACHE_PATH, "w") as f:
+                json.dump(dict(self.user_tokens), f)
+            os.chmod(TOKEN_CACHE_PATH, 0o600)
+        except Exception as e:
+            logger.warning(f"Could not persist OBO token cache: {e}")
+
+    async def exchange_for_databricks_token(self, user_id: str, user_token: str) -> Optional[str]:
         """
         Exchange user token for Databricks-scoped token via OBO flow.
-        
+
+        Concurrent calls for the same user share a single in-flight exchange.
+
         Args:
             user_id: User identifier for caching
             user_token: User's access token from Teams SSO
-            
+
         Returns:
             Databricks-scoped access token, or None if exchange fails
         """
         # Check cache first
         cached = self.user_tokens.get(user_id)
         if cached and cached.get('expires_at', 0) > datetime.now().timestamp():
-            logger.info(f"Using cached Databricks token for user {user_id}")
+            logger.info("Using cached Databricks token for user %s", user_id)
             return cached.get('token')
-        
+
+        # Join any exchange already in flight for this user
+        inflight = self._inflight.get(user_id)
+        if inflight is not None:
+            logger.info("Awaiting in-flight OBO exchange for user %s", user_id)
+            return await inflight
+
+        task = asyncio.ensure_future(self._do_exchange(user_id, user_token))
+        self._inflight[user_id] = task
+        try:
+            return await task
+        finally:
+            self._inflight.pop(user_id, None)
+
+    async def _do_exchange(self, user_id: str, user_token: str) -> Optional[str]:
+        """Run the blocking exchange off-loop, then cache the result on-loop."""
+        loop = asyncio.get_running_loop()
+        exchanged = await loop.run_in_executor(AUTH_EXECUTOR, self._exchange_sync, user_id, user_token)
+        if exchanged is None:
+            return None
+
+        token, expires_at = exchanged
+        # Cache writes stay on the event loop: TTLCache is not thread-safe,
+        # so the AUTH_EXECUTOR threads must never touch user_tokens (the
+        # in-flight dedup above guarantees one exchange per user)
+        self.user_tokens[user_id] = {'token': token, 'expires_at': expires_at}
+        self._persist_token_cache()
+        return token
+
+    def _exchange_sync(self, user_id: str, user_token: str) -> Optional[Tuple[str, float]]:
+        """Blocking MSAL OBO exchange. Runs on an executor thread.
+
+        Returns (token, expires_at) on success; the caller owns caching.
+        """
         try:
             # OBO exchange for Databricks scope
             result = self.msal_app.acquire_token_on_behalf_of(
                 user_assertion=user_token,
                 scopes=[f"{DATABRICKS_RESOURCE_ID}/user_impersonation"]
             )
-            
+
+            # Normal (non-long-running) OBO: the access token is cached above
+            # keyed by user_id, so drop MSAL's internal copy to keep its
+            # refresh-token scan O(1) regardless of user count.
+            self._msal_cache.deserialize(None)
+
             if "access_token" in result:
                 token = result["access_token"]
                 expires_in = result.get("expires_in", 3600)
-                
-                # Cache the token
-                self.user_tokens[user_id] = {
-                    'token': token,
-                    'expires_at': datetime.now().timestamp() + expires_in - 60  # 60s buffer
-                }
-                
-                logger.info(f"OBO exchange successful for user {user_id}, expires in {expires_in}s")
-                return token
+                logger.info("OBO exchange successful for user %s, expires in %ss", user_id, expires_in)
+                return token, datetime.now().timestamp() + expires_in - 60  # 60s buffer
             else:
                 error = result.get('error_description', result.get('error', 'Unknown error'))
-                logger.error(f"OBO exchange failed for user {user_id}: {error}")
+                logger.error("OBO exchange failed for user %s: %s", user_id, error)
                 return None
                 
         except Exception as e:
-            logger.error(f"OBO exchange error for user {user_id}: {e}")
+            logger.error("OBO exchange error for user %s: %s", user_id, e)
             logger.error(traceback.format_exc())
             return None
     
@@ -209,7 +411,8 @@ class UserTokenManager:
         """Clear cached token for a user."""
         if user_id in self.user_tokens:
             del self.user_tokens[user_id]
-            logger.info(f"Cleared cached token for user {user_id}")
+            self._persist_token_cache()
+            logger.info("Cleared cached token for user %s", user_id)
 
 
 # Initialize token manager
@@ -220,6 +423,26 @@ TOKEN_MANAGER = UserTokenManager(APP_ID, APP_PASSWORD, APP_TENANT_ID) if APP_ID
 # Genie Client - Using User Token Authentication
 # =============================================================================
 
+# Shared executor for blocking Databricks SDK calls. Genie queries can poll for
+# up to 5 minutes, so they must never run on the event loop - this pool lets
+# many users' queries overlap instead of serializing behind one another.
+GENIE_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="genie")
+
+
+@lru_cache(maxsize=1000)
+def _get_workspace_client(host: str, token: str):
+    """
+    Return a cached WorkspaceClient for this host/token pair.
+
+    A fresh WorkspaceClient per message meant a new requests.Session and a new
+    TCP+TLS handshake to Databricks on every query; caching keyed by token lets
+    repeat queries from the same user reuse the pooled connections.
+    """
+    from databricks.sdk import WorkspaceClient
+
+    return WorkspaceClient(host=host, token=token)
+
+
 class GenieClient:
     """Client for interacting with Databricks Genie API using user token."""
     
@@ -234,37 +457,33 @@ class GenieClient:
         """
         self.space_id = space_id
         self.host = host
-        # Use user token authentication
-        self.client = WorkspaceClient(host=host, token=token)
-        logger.info(f"GenieClient initialized for space: {space_id} (using user token auth)")
+        # Use user token authentication with a shared, connection-pooled client
+        self.client = _get_workspace_client(host, token)
+        logger.info("GenieClient initialized for space: %s (using user token auth)", space_id)
     
-    def ask_question(self, question: str) -> Dict[str, Any]:
+    async def ask_question(self, question: str) -> Dict[str, Any]:
         """
         Start a new conversation with a question.
-        
+
         Args:
             question: Natural language question
-            
+
         Returns:
             Dictionary with text response, SQL, data, and conversation_id
         """
         # Append instruction to include visualization spec
         question_with_viz = f"{question}\n\n**IMPORTANT** Make sure to include [VIZ_START] visualization block in your response."
-        logger.info(f"Asking Genie: {question}")
-        
+        logger.info("Asking Genie: %s", question)
+
         try:
-            # Start conversation and wait for completion
-            response = self.client.genie.start_conversation_and_wait(
-                space_id=self.space_id,
-                content=question_with_viz,
-                timeout=timedelta(minutes=5)
-            )
-            
-            logger.info(f"Genie response received - conversation_id: {response.conversation_id}")
-            return self._parse_response(response)
-            
+            # The whole call-plus-parse pipeline runs on the shared executor:
+            # _parse_response can itself issue blocking attachment-result
+            # fetches, so it must stay off the event loop too
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(GENIE_EXECUTOR, self._ask_sync, question_with_viz)
+
         except Exception as e:
-            logger.error(f"Error asking Genie: {e}")
+            logger.error("Error asking Genie: %s", e)
             logger.error(traceback.format_exc())
             return {
                 "text": f"Sorry, I encountered an error: {str(e)}",
@@ -275,35 +494,30 @@ class GenieClient:
                 "error": True
             }
     
-    def follow_up(self, conversation_id: str, question: str) -> Dict[str, Any]:
+    async def follow_up(self, conversation_id: str, question: str) -> Dict[str, Any]:
         """
         Send a follow-up question in an existing conversation.
-        
+
         Args:
             conversation_id: Existing conversation ID
             question: Follow-up question
-            
+
         Returns:
             Dictionary with text response, SQL, data, and conversation_id
         """
         question_with_viz = f"{question}\n\nMake sure to include [VIZ_START] visualization block in your response."
-        logger.info(f"Follow-up in conversation {conversation_id}: {question}")
-        
+        logger.info("Follow-up in conversation %s: %s", conversation_id, question)
+
         try:
-            response = self.client.genie.create_message_and_wait(
-                space_id=self.space_id,
-                conversation_id=conversation_id,
-                content=question_with_viz,
-                timeout=timedelta(minutes=5)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                GENIE_EXECUTOR, self._follow_up_sync, conversation_id, question_with_viz
             )
-            
-            logger.info(f"Genie follow-up response received")
-            result = self._parse_response(response)
             result["conversation_id"] = conversation_id
             return result
-            
+
         except Exception as e:
-            logger.error(f"Error in follow-up: {e}")
+            logger.error("Error in follow-up: %s", e)
             logger.error(traceback.format_exc())
             return {
                 "text": f"Sorry, I encountered an error: {str(e)}",
@@ -314,6 +528,27 @@ class GenieClient:
                 "error": True
             }
     
+    def _ask_sync(self, question_with_viz: str) -> Dict[str, Any]:
+        """Blocking start-conversation call plus parse, run on GENIE_EXECUTOR."""
+        response = self.client.genie.start_conversation_and_wait(
+            space_id=self.space_id,
+            content=question_with_viz,
+            timeout=timedelta(minutes=5)
+        )
+        logger.info("Genie response received - conversation_id: %s", response.conversation_id)
+        return self._parse_response(response)
+
+    def _follow_up_sync(self, conversation_id: str, question_with_viz: str) -> Dict[str, Any]:
+        """Blocking follow-up call plus parse, run on GENIE_EXECUTOR."""
+        response = self.client.genie.create_message_and_wait(
+            space_id=self.space_id,
+            conversation_id=conversation_id,
+            content=question_with_viz,
+            timeout=timedelta(minutes=5)
+        )
+        logger.info("Genie follow-up response received")
+        return self._parse_response(response)
+
     def _parse_response(self, genie_message) -> Dict[str, Any]:
         """
         Parse GenieMessage to extract text, SQL, and data.
@@ -335,90 +570,87 @@ class GenieClient:
         }
         
         # Check for error status
-        if hasattr(genie_message, 'status') and genie_message.status in ['FAILED', 'CANCELLED']:
+        if getattr(genie_message, 'status', None) in ['FAILED', 'CANCELLED']:
             error_msg = getattr(genie_message, 'error', None)
             result["text"] = f"Query failed: {error_msg}" if error_msg else "Query was cancelled or failed."
             result["error"] = True
             return result
-        
+
         # Collect all text parts from attachments
         text_parts = []
-        
-        # Process attachments
-        if hasattr(genie_message, 'attachments') and genie_message.attachments:
-            for attachment in genie_message.attachments:
-                # Extract text responses
-                if hasattr(attachment, 'text') and attachment.text:
-                    if hasattr(attachment.text, 'content') and attachment.text.content:
-                        text_parts.append(attachment.text.content)
-                
-                # Extract SQL query
-                if hasattr(attachment, 'query') and attachment.query:
-                    if hasattr(attachment.query, 'query'):
-                        result["sql"] = attachment.query.query
-                    if hasattr(attachment.query, 'description') and attachment.query.description:
-                        desc = attachment.query.description
-                        if desc and desc not in text_parts:
-                            text_parts.insert(0, desc)
-                
-                # Extract suggested follow-up questions
-                if hasattr(attachment, 'suggested_questions') and attachment.suggested_questions:
-                    sq = attachment.suggested_questions
-                    if hasattr(sq, 'questions') and sq.questions:
-                        result["suggested_questions"] = list(sq.questions)
-                        logger.info(f"Found {len(result['suggested_questions'])} suggested questions")
-        
+        attachments = getattr(genie_message, 'attachments', None) or []
+        # Attachment ids gathered in the same pass, used only if the message
+        # itself carries no query result
+        pending_ids: List[str] = []
+
+        # Process attachments (single pass)
+        for attachment in attachments:
+            att_id = getattr(attachment, 'attachment_id', None)
+            if att_id:
+                pending_ids.append(att_id)
+
+            # Extract text responses
+            text = getattr(attachment, 'text', None)
+            content = getattr(text, 'content', None) if text else None
+            if content:
+                text_parts.append(content)
+
+            # Extract SQL query
+            query = getattr(attachment, 'query', None)
+            if query:
+                result["sql"] = getattr(query, 'query', None)
+                desc = getattr(query, 'description', None)
+                if desc and desc not in text_parts:
+                    text_parts.insert(0, desc)
+
+            # Extract suggested follow-up questions
+            sq = getattr(attachment, 'suggested_questions', None)
+            questions = getattr(sq, 'questions', None) if sq else None
+            if questions:
+                result["suggested_questions"] = list(questions)
+                logger.info("Found %d suggested questions", len(result['suggested_questions']))
+
         # Combine all text parts
         if text_parts:
             result["text"] = "\n\n".join(text_parts)
-        
+
         # Get query results from the message's query_result attribute
-        if hasattr(genie_message, 'query_result') and genie_message.query_result:
-            qr = genie_message.query_result
-            logger.info(f"Found query_result on message with {getattr(qr, 'row_count', 0)} rows")
-            
-            if hasattr(qr, 'statement_response') and qr.statement_response:
-                stmt_resp = qr.statement_response
-                if hasattr(stmt_resp, 'manifest') and stmt_resp.manifest:
-                    if hasattr(stmt_resp.manifest, 'schema') and stmt_resp.manifest.schema:
-                        if hasattr(stmt_resp.manifest.schema, 'columns'):
-                            result["columns"] = [
-                                col.name for col in stmt_resp.manifest.schema.columns
-                            ]
-                if hasattr(stmt_resp, 'result') and stmt_resp.result:
-                    if hasattr(stmt_resp.result, 'data_array'):
-                        result["data_rows"] = stmt_resp.result.data_array or []
-                        logger.info(f"Extracted {len(result['data_rows'])} data rows")
-        
-        # If no results yet, try fetching via API using attachment_id
-        if not result["data_rows"] and hasattr(genie_message, 'attachments') and genie_message.attachments:
-            for attachment in genie_message.attachments:
-                att_id = getattr(attachment, 'attachment_id', None)
-                if att_id and result["conversation_id"]:
-                    try:
-                        query_result = self.client.genie.get_message_attachment_query_result(
-                            space_id=self.space_id,
-                            conversation_id=result["conversation_id"],
-                            message_id=genie_message.id,
-                            attachment_id=att_id
-                        )
-                        
-                        if hasattr(query_result, 'statement_response') and query_result.statement_response:
-                            stmt_resp = query_result.statement_response
-                            if hasattr(stmt_resp, 'manifest') and stmt_resp.manifest:
-                                if hasattr(stmt_resp.manifest, 'schema') and stmt_resp.manifest.schema:
-                                    if hasattr(stmt_resp.manifest.schema, 'columns'):
-                                        result["columns"] = [
-                                            col.name for col in stmt_resp.manifest.schema.columns
-                                        ]
-                            if hasattr(stmt_resp, 'result') and stmt_resp.result:
-                                if hasattr(stmt_resp.result, 'data_array') and stmt_resp.result.data_array:
-                                    result["data_rows"] = stmt_resp.result.data_array
-                                    logger.info(f"Fetched {len(result['data_rows'])} rows via attachment API")
-                                    break
-                                    
-                    except Exception as e:
-                        logger.warning(f"Could not fetch query result for attachment {att_id}: {e}")
+        qr = getattr(genie_message, 'query_result', None)
+        if qr:
+            logger.info("Found query_result on message with %s rows", getattr(qr, 'row_count', 0))
+
+            stmt_resp = getattr(qr, 'statement_response', None)
+            if stmt_resp:
+                columns, data_rows = self._extract_statement_data(stmt_resp)
+                if columns:
+                    result["columns"] = columns
+                if data_rows is not None:
+                    result["data_rows"] = data_rows
+                    logger.info("Extracted %d data rows", len(result['data_rows']))
+
+        # If no results yet, try fetching via API using the collected attachment ids
+        if not result["data_rows"] and result["conversation_id"]:
+            for att_id in pending_ids:
+                try:
+                    query_result = self.client.genie.get_message_attachment_query_result(
+                        space_id=self.space_id,
+                        conversation_id=result["conversation_id"],
+                        message_id=genie_message.id,
+                        attachment_id=att_id
+                    )
+
+                    stmt_resp = getattr(query_result, 'statement_response', None)
+                    if stmt_resp:
+                        columns, data_rows = self._extract_statement_data(stmt_resp)
+                        if columns:
+                            result["columns"] = columns
+                        if data_rows:
+                            result["data_rows"] = data_rows
+                            logger.info("Fetched %d rows via attachment API", len(result['data_rows']))
+                            break
+
+                except Exception as e:
+                    logger.warning("Could not fetch query result for attachment %s: %s", att_id, e)
         
         # Default text if none found
         if not result["text"]:
@@ -426,14 +658,53 @@ class GenieClient:
                 result["text"] = "Here's what I found:"
             else:
                 result["text"] = "I processed your question but didn't find a specific answer."
-        
+
         return result
 
+    def _extract_statement_data(self, stmt_resp) -> Tuple[List[str], Optional[List[List[Any]]]]:
+        """
+        Pull column names and data rows out of a StatementResponse.
+
+        Returns:
+            Tuple of (column names, data rows). data_rows is None when the
+            response carries no result block at all.
+        """
+        columns: List[str] = []
+        manifest = getattr(stmt_resp, 'manifest', None)
+        schema = getattr(manifest, 'schema', None) if manifest else None
+        schema_columns = getattr(schema, 'columns', None) if schema else None
+        if schema_columns:
+            columns = [col.name for col in schema_columns]
+
+        data_rows = None
+        stmt_result = getattr(stmt_resp, 'result', None)
+        if stmt_result is not None:
+            data_rows = getattr(stmt_result, 'data_array', None) or []
+
+        return columns, data_rows
+
 
 # =============================================================================
 # Visualization Spec Parser
 # =============================================================================
 
+KNOWN_VIZ_FIELDS = ['chart_type', 'x_label', 'y_label', 'x_axis', 'y_axis', 'title', 'sort']
+
+# Patterns compiled once at import - parse_viz_spec runs on every Genie response
+_VIZ_RE = re.compile(r'\[VIZ_START\](.*?)\[VIZ_END\]', re.DOTALL | re.IGNORECASE)
+_FIELD_RES = {
+    field: re.compile(
+        rf'{field}\s*:\s*(.+?)(?=\s+(?:{"|".join(f for f in KNOWN_VIZ_FIELDS if f != field)})\s*:|$)',
+        re.IGNORECASE
+    )
+    for field in KNOWN_VIZ_FIELDS
+}
+
+# Currency/percent stripping for numeric coercion - a str.translate table is
+# a single C-level pass, works per-cell and (via np.char.translate) column-wide
+_CURRENCY_TABLE = str.maketrans('', '', '$,€£%')
+
+
 def parse_viz_spec(text: str) -> Tuple[Optional[Dict[str, str]], str]:
     """
     Extract visualization specification from Genie response text.
@@ -449,17 +720,14 @@ def parse_viz_spec(text: str) -> Tuple[Optional[Dict[str, str]], str]:
     if not text:
         return None, text
     
-    pattern = r'\[VIZ_START\](.*?)\[VIZ_END\]'
-    match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-    
+    match = _VIZ_RE.search(text)
+
     if not match:
         return None, text
-    
+
     viz_block = match.group(1).strip()
     spec: Dict[str, str] = {}
-    
-    known_fields = ['chart_type', 'x_label', 'y_label', 'x_axis', 'y_axis', 'title', 'sort']
-    
+
     if '\n' in viz_block:
         for line in viz_block.split('\n'):
             line = line.strip()
@@ -467,23 +735,20 @@ def parse_viz_spec(text: str) -> Tuple[Optional[Dict[str, str]], str]:
                 key, value = line.split(':', 1)
                 spec[key.strip().lower()] = value.strip()
     else:
-        for field in known_fields:
-            other_fields = [f for f in known_fields if f != field]
-            lookahead = '|'.join(other_fields)
-            field_pattern = rf'{field}\s*:\s*(.+?)(?=\s+(?:{lookahead})\s*:|$)'
-            field_match = re.search(field_pattern, viz_block, re.IGNORECASE)
+        for field, field_re in _FIELD_RES.items():
+            field_match = field_re.search(viz_block)
             if field_match:
                 spec[field] = field_match.group(1).strip()
-    
+
     required_fields = ['chart_type', 'x_axis', 'y_axis']
     if not all(field in spec for field in required_fields):
-        logger.warning(f"VIZ spec missing required fields. Found: {list(spec.keys())}")
+        logger.warning("VIZ spec missing required fields. Found: %s", list(spec.keys()))
         return None, text
+
+    cleaned_text = _VIZ_RE.sub('', text).strip()
     
-    cleaned_text = re.sub(pattern, '', text, flags=re.DOTALL | re.IGNORECASE).strip()
-    
-    logger.info(f"Parsed VIZ spec: chart_type={spec.get('chart_type')}, "
-                f"x_axis={spec.get('x_axis')}, y_axis={spec.get('y_axis')}")
+    logger.info("Parsed VIZ spec: chart_type=%s, x_axis=%s, y_axis=%s",
+                spec.get('chart_type'), spec.get('x_axis'), spec.get('y_axis'))
     
     return spec, cleaned_text
 
@@ -497,23 +762,48 @@ CHART_COLORS: List[str] = [
     '#AB4057', '#99DDB4', '#FCA4A1', '#919191', '#BF7080',
 ]
 
+# The palette is static - serialize it once instead of per chart request
+COLORS_JSON: bytes = orjson.dumps(CHART_COLORS)
+
 
 class ChartGenerator:
     """Generates chart images from query data using matplotlib."""
     
     def __init__(self, colors: Optional[List[str]] = None):
         self.colors = colors or CHART_COLORS
-        self.figure_size = (8, 5)
-        self.dpi = 80
-    
+        # Teams renders chart previews small - 6x3.5in at 72dpi is plenty and
+        # roughly halves PNG bytes versus the old 8x5in at 80dpi.
+        self.figure_size = (6, 3.5)
+        self.dpi = 72
+        # One Figure reused across renders - Figure/Axes construction is the
+        # dominant cost for small charts. The lock serializes renders since
+        # aiohttp handlers run concurrently and matplotlib is not thread-safe.
+        self._fig = None
+        self._canvas = None
+        self._ax = None
+        self._render_lock = threading.Lock()
+
+    def _get_axes(self, figsize: Tuple[float, float]) -> Tuple[Any, Any]:
+        """Return the shared Figure/Axes, cleared and resized for a new render."""
+        if self._fig is None:
+            self._fig = Figure(figsize=figsize, dpi=self.dpi)
+            self._canvas = FigureCanvasAgg(self._fig)
+            self._ax = self._fig.add_subplot(111)
+        else:
+            self._fig.set_size_inches(*figsize)
+            self._ax.clear()
+        return self._fig, self._ax
+
+
     def generate(
         self,
         viz_spec: Dict[str, str],
         columns: List[str],
         data_rows: List[List[Any]]
-    ) -> Optional[str]:
-        """Generate a chart image as a base64-encoded PNG string."""
+    ) -> Optional[bytes]:
+        """Generate a chart image as raw PNG bytes."""
         try:
+            _load_matplotlib()
             chart_type = viz_spec.get('chart_type', 'bar').lower()
             x_col = viz_spec.get('x_axis', '')
             y_col = viz_spec.get('y_axis', '')
@@ -530,21 +820,24 @@ class ChartGenerator:
             y_idx = self._get_column_index(columns, y_col)
             
             if x_idx is None or y_idx is None:
-                logger.error(f"Column not found. x_col={x_col}, y_col={y_col}, columns={columns}")
+                logger.error("Column not found. x_col=%s, y_col=%s, columns=%s", x_col, y_col, columns)
                 return None
             
-            x_data = [row[x_idx] for row in data_rows if row[x_idx] is not None]
-            y_data = [self._to_numeric(row[y_idx]) for row in data_rows if row[x_idx] is not None]
-            
-            if not x_data or not y_data:
+            x_data, y_data = self._extract_columns(data_rows, x_idx, y_idx)
+
+            if not len(x_data) or not len(y_data):
                 logger.warning("No valid data for chart generation")
                 return None
             
             if sort_order in ['asc', 'desc']:
-                paired = list(zip(x_data, y_data))
-                paired.sort(key=lambda x: x[1], reverse=(sort_order == 'desc'))
-                x_data, y_data = zip(*paired) if paired else ([], [])
-                x_data, y_data = list(x_data), list(y_data)
+                # argsort + fancy indexing instead of zip/sort/unzip tuple churn
+                x_arr = np.asarray(x_data, dtype=object)
+                y_arr = np.asarray(y_data, dtype=float)
+                order = np.argsort(y_arr)
+                if sort_order == 'desc':
+                    order = order[::-1]
+                x_data = list(x_arr[order])
+                y_data = list(y_arr[order])
             
             chart_methods = {
                 'bar': self._create_bar_chart,
@@ -555,20 +848,55 @@ class ChartGenerator:
             }
             
             chart_method = chart_methods.get(chart_type, self._create_bar_chart)
-            
-            return chart_method(
-                x_data=x_data,
-                y_data=y_data,
-                title=title,
-                x_label=x_label,
-                y_label=y_label
-            )
-            
+
+            with self._render_lock:
+                return chart_method(
+                    x_data=x_data,
+                    y_data=y_data,
+                    title=title,
+                    x_label=x_label,
+                    y_label=y_label
+                )
+
         except Exception as e:
-            logger.error(f"Error generating chart: {e}")
+            logger.error("Error generating chart: %s", e)
             logger.error(traceback.format_exc())
             return None
     
+    def _extract_columns(
+        self,
+        data_rows: List[List[Any]],
+        x_idx: int,
+        y_idx: int
+    ) -> Tuple[List[Any], List[float]]:
+        """Extract x/y columns in one pass, vectorized with NumPy where possible."""
+        arr = np.array(data_rows, dtype=object)
+        if arr.ndim != 2:
+            # Ragged rows - fall back to the plain Python path
+            x_data = [row[x_idx] for row in data_rows if row[x_idx] is not None]
+            y_data = [self._to_numeric(row[y_idx]) for row in data_rows if row[x_idx] is not None]
+            return x_data, y_data
+
+        mask = np.array([v is not None for v in arr[:, x_idx]])
+        x_data = arr[mask, x_idx]
+        y_data = self._to_numeric_array(arr[mask, y_idx])
+        return list(x_data), list(y_data)
+
+    def _to_numeric_array(self, values: np.ndarray) -> np.ndarray:
+        """Coerce a column of values to float64 without a per-cell Python loop."""
+        try:
+            # Fast path: already numeric or clean numeric strings
+            return values.astype(np.float64)
+        except (ValueError, TypeError):
+            pass
+        try:
+            # Strip currency/percent symbols across the whole column at once
+            cleaned = np.char.translate(values.astype(str), _CURRENCY_TABLE)
+            return cleaned.astype(np.float64)
+        except (ValueError, TypeError):
+            # Mixed/dirty data - last resort per-cell coercion
+            return np.array([self._to_numeric(v) for v in values], dtype=np.float64)
+
     def _get_column_index(self, columns: List[str], col_name: str) -> Optional[int]:
         col_name_lower = col_name.lower()
         for i, col in enumerate(columns):
@@ -577,27 +905,31 @@ class ChartGenerator:
         return None
     
     def _to_numeric(self, value: Any) -> float:
-        if value is None:
-            return 0.0
+        # Common case first: SQL numeric columns arrive as int/float
         if isinstance(value, (int, float)):
             return float(value)
+        if value is None:
+            return 0.0
+        s = str(value)
+        # Digit-only strings skip the regex entirely
+        if s.isdigit():
+            return float(s)
         try:
-            cleaned = re.sub(r'[$,€£%]', '', str(value))
-            return float(cleaned)
+            return float(s.translate(_CURRENCY_TABLE) or 0)
         except (ValueError, TypeError):
             return 0.0
     
-    def _finalize_chart(self, fig: plt.Figure) -> str:
+    def _finalize_chart(self, fig) -> bytes:
+        # Single tight_layout pass instead of bbox_inches='tight', which
+        # re-runs the layout engine twice inside savefig
+        fig.tight_layout(pad=0.3)
+        fig.set_facecolor('white')
         buf = io.BytesIO()
-        fig.savefig(buf, format='png', dpi=self.dpi, bbox_inches='tight',
-                    facecolor='white', edgecolor='none')
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.getvalue()).decode('utf-8')
-        plt.close(fig)
-        return img_base64
+        self._canvas.print_png(buf)
+        return buf.getvalue()
     
-    def _create_bar_chart(self, x_data, y_data, title, x_label, y_label) -> str:
-        fig, ax = plt.subplots(figsize=self.figure_size)
+    def _create_bar_chart(self, x_data, y_data, title, x_label, y_label) -> bytes:
+        fig, ax = self._get_axes(self.figure_size)
         
         max_bars = 15
         if len(x_data) > max_bars:
@@ -606,27 +938,26 @@ class ChartGenerator:
         
         colors = [self.colors[i % len(self.colors)] for i in range(len(x_data))]
         y_pos = range(len(x_data))
-        ax.barh(y_pos, y_data, color=colors, edgecolor='white', linewidth=0.5)
-        
+        container = ax.barh(y_pos, y_data, color=colors, edgecolor='white', linewidth=0.5)
+
         ax.set_yticks(y_pos)
         ax.set_yticklabels([str(x)[:30] for x in x_data])
         ax.invert_yaxis()
         ax.set_xlabel(y_label)
         ax.set_title(title, fontsize=14, fontweight='bold', pad=15)
-        
-        for i, (val, bar) in enumerate(zip(y_data, ax.patches)):
-            ax.text(bar.get_width() + max(y_data) * 0.01, bar.get_y() + bar.get_height() / 2,
-                    self._format_number(val), va='center', fontsize=9)
+
+        # One batched bar_label call instead of N individual ax.text artists
+        ax.bar_label(container, labels=[self._format_number(v) for v in y_data],
+                     padding=3, fontsize=9)
         
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.xaxis.set_major_formatter(ticker.FuncFormatter(lambda x, _: self._format_number(x)))
         
-        fig.tight_layout()
         return self._finalize_chart(fig)
     
-    def _create_line_chart(self, x_data, y_data, title, x_label, y_label) -> str:
-        fig, ax = plt.subplots(figsize=self.figure_size)
+    def _create_line_chart(self, x_data, y_data, title, x_label, y_label) -> bytes:
+        fig, ax = self._get_axes(self.figure_size)
         
         ax.plot(range(len(x_data)), y_data, color=self.colors[0], linewidth=2,
                 marker='o', markersize=6, markerfacecolor='white', markeredgewidth=2)
@@ -643,20 +974,22 @@ class ChartGenerator:
         ax.yaxis.set_major_formatter(ticker.FuncFormatter(lambda x, _: self._format_number(x)))
         ax.grid(axis='y', alpha=0.3)
         
-        fig.tight_layout()
         return self._finalize_chart(fig)
     
-    def _create_pie_chart(self, x_data, y_data, title, x_label, y_label) -> str:
-        fig, ax = plt.subplots(figsize=(8, 8))
+    def _create_pie_chart(self, x_data, y_data, title, x_label, y_label) -> bytes:
+        fig, ax = self._get_axes((6, 6))
         
         max_slices = 8
         if len(x_data) > max_slices:
-            paired = list(zip(x_data, y_data))
-            paired.sort(key=lambda x: x[1], reverse=True)
-            top_items = paired[:max_slices - 1]
-            other_sum = sum(item[1] for item in paired[max_slices - 1:])
-            x_data = [item[0] for item in top_items] + ['Other']
-            y_data = [item[1] for item in top_items] + [other_sum]
+            # O(n) top-N selection via argpartition, then sort just the top slice
+            x_arr = np.asarray(x_data, dtype=object)
+            y_arr = np.asarray(y_data, dtype=float)
+            top_n = max_slices - 1
+            top_idx = np.argpartition(y_arr, -top_n)[-top_n:]
+            top_idx = top_idx[np.argsort(y_arr[top_idx])[::-1]]
+            other_sum = float(y_arr.sum() - y_arr[top_idx].sum())
+            x_data = list(x_arr[top_idx]) + ['Other']
+            y_data = list(y_arr[top_idx]) + [other_sum]
         
         colors = [self.colors[i % len(self.colors)] for i in range(len(x_data))]
         
@@ -677,11 +1010,10 @@ class ChartGenerator:
         )
         
         ax.set_title(title, fontsize=14, fontweight='bold', pad=15)
-        fig.tight_layout()
         return self._finalize_chart(fig)
     
-    def _create_scatter_chart(self, x_data, y_data, title, x_label, y_label) -> str:
-        fig, ax = plt.subplots(figsize=self.figure_size)
+    def _create_scatter_chart(self, x_data, y_data, title, x_label, y_label) -> bytes:
+        fig, ax = self._get_axes(self.figure_size)
         
         x_numeric = [self._to_numeric(x) for x in x_data]
         ax.scatter(x_numeric, y_data, c=self.colors[0], s=80, alpha=0.7,
@@ -695,11 +1027,10 @@ class ChartGenerator:
         ax.spines['right'].set_visible(False)
         ax.grid(alpha=0.3)
         
-        fig.tight_layout()
         return self._finalize_chart(fig)
     
-    def _create_area_chart(self, x_data, y_data, title, x_label, y_label) -> str:
-        fig, ax = plt.subplots(figsize=self.figure_size)
+    def _create_area_chart(self, x_data, y_data, title, x_label, y_label) -> bytes:
+        fig, ax = self._get_axes(self.figure_size)
         
         ax.fill_between(range(len(x_data)), y_data, alpha=0.4, color=self.colors[0])
         ax.plot(range(len(x_data)), y_data, color=self.colors[0], linewidth=2)
@@ -715,7 +1046,6 @@ class ChartGenerator:
         ax.yaxis.set_major_formatter(ticker.FuncFormatter(lambda x, _: self._format_number(x)))
         ax.grid(axis='y', alpha=0.3)
         
-        fig.tight_layout()
         return self._finalize_chart(fig)
     
     def _format_number(self, value: float) -> str:
@@ -739,6 +1069,40 @@ chart_generator = ChartGenerator()
 
 PAGE_SIZE = 20
 
+# Above this row count, paginating through a result means many card
+# round-trips - offer a one-shot CSV download instead
+CSV_DOWNLOAD_THRESHOLD = 200
+
+# Invariant outer keys shared by every card we build - spread into each card
+# dict instead of re-typing (and re-allocating string keys for) the envelope
+_CARD_SKELETON = {
+    "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
+    "type": "AdaptiveCard",
+    "version": "1.5",
+    "msteams": {"width": "Full"},
+}
+
+
+def _text_cell(val: Any) -> Dict[str, Any]:
+    """Build a TableCell for a data value (stringified once, truncated at 50)."""
+    if val is None:
+        text = "-"
+    else:
+        s = val if type(val) is str else str(val)
+        text = s if len(s) <= 50 else s[:50] + "..."
+    return {
+        "type": "TableCell",
+        "items": [{"type": "TextBlock", "text": text, "wrap": True}]
+    }
+
+
+def _header_cell(col: Any) -> Dict[str, Any]:
+    """Build a bold TableCell for a column header."""
+    return {
+        "type": "TableCell",
+        "items": [{"type": "TextBlock", "text": str(col), "weight": "Bolder", "wrap": True}]
+    }
+
 
 def create_paginated_card(
     result: Dict[str, Any], 
@@ -769,24 +1133,17 @@ def create_paginated_card(
         })
     
     if columns and page_rows:
-        table_columns = [{"width": 1} for _ in columns]
-        
-        header_cells = [{
-            "type": "TableCell",
-            "items": [{"type": "TextBlock", "text": str(col), "weight": "Bolder", "wrap": True}]
-        } for col in columns]
-        
+        # Shared read-only column spec - the serializer never mutates it
+        table_columns = [{"width": 1}] * len(columns)
+
+        header_cells = [_header_cell(col) for col in columns]
+
+        # Comprehension-built rows: LIST_APPEND beats repeated .append lookups
         table_rows = [{"type": "TableRow", "cells": header_cells, "style": "accent"}]
-        
-        for row in page_rows:
-            row_cells = []
-            for val in row:
-                display_val = "-" if val is None else str(val)[:50] + ("..." if len(str(val)) > 50 else "")
-                row_cells.append({
-                    "type": "TableCell",
-                    "items": [{"type": "TextBlock", "text": display_val, "wrap": True}]
-                })
-            table_rows.append({"type": "TableRow", "cells": row_cells})
+        table_rows.extend(
+            {"type": "TableRow", "cells": [_text_cell(val) for val in row]}
+            for row in page_rows
+        )
         
         body.append({
             "type": "Table",
@@ -811,18 +1168,18 @@ def create_paginated_card(
             "title": "Next >",
             "data": {"action": "pagination", "direction": "next", "page": page + 1, "result_id": result_id}
         })
-    
-    card = {
-        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-        "type": "AdaptiveCard",
-        "version": "1.5",
-        "body": body,
-        "msteams": {"width": "Full"}
-    }
-    
+    if result_id and total_rows > CSV_DOWNLOAD_THRESHOLD and BOT_PUBLIC_URL:
+        actions.append({
+            "type": "Action.OpenUrl",
+            "title": f"Download all {total_rows} rows (CSV)",
+            "url": f"{BOT_PUBLIC_URL}/results/{result_id}.csv"
+        })
+
+    card = {**_CARD_SKELETON, "body": body}
+
     if actions:
         card["actions"] = actions
-    
+
     return card
 
 
@@ -831,15 +1188,14 @@ def create_card_attachment(card: Dict[str, Any]) -> Attachment:
 
 
 def create_chart_card(
-    chart_image_base64: str,
+    chart_url: str,
     title: str,
     result_id: str,
     chart_type: str = "bar",
     interactive_url: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Create an Adaptive Card displaying a chart image."""
-    image_url = f"data:image/png;base64,{chart_image_base64}"
-    
+    """Create an Adaptive Card displaying a chart image served from /charts/{id}."""
+
     actions = [{
         "type": "Action.Submit",
         "title": "View Data Table",
@@ -854,15 +1210,164 @@ def create_chart_card(
         })
     
     return {
-        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-        "type": "AdaptiveCard",
-        "version": "1.5",
+        **_CARD_SKELETON,
+        "body": [
+            {"type": "TextBlock", "text": title, "weight": "Bolder", "size": "Large", "wrap": True},
+            {"type": "Image", "url": chart_url, "size": "Stretch", "altText": f"{chart_type.title()} chart: {title}"}
+        ],
+        "actions": actions,
+    }
+
+
+# Static sign-in card, built once - every unauthenticated turn sends the same
+# card, so there is no reason to reallocate the nested dicts per message.
+SIGNIN_CARD = {
+    **_CARD_SKELETON,
+    "body": [
+        {
+            "type": "TextBlock",
+            "text": "Authentication Required",
+            "weight": "Bolder",
+            "size": "Large"
+        },
+        {
+            "type": "TextBlock",
+            "text": "Please sign in to access Databricks Genie and query your data.",
+            "wrap": True
+        },
+        {
+            "type": "TextBlock",
+            "text": "Your queries will run with your own identity and permissions.",
+            "wrap": True,
+            "size": "Small",
+            "isSubtle": True
+        }
+    ],
+    "actions": [
+        {
+            "type": "Action.Submit",
+            "title": "Sign In",
+            "data": {"action": "signin"}
+        }
+    ],
+}
+
+# Shared attachment wrapper - neither the SDK nor our code mutates it
+SIGNIN_ATTACHMENT = create_card_attachment(SIGNIN_CARD)
+
+WELCOME_TEXT = (
+    "**Welcome to Databricks Genie Bot!**\n\n"
+    "I can help you explore and analyze your data using natural language.\n\n"
+    "**Getting Started:**\n"
+    "1. Send any message to begin\n"
+    "2. You'll be asked to sign in (one-time)\n"
+    "3. Your queries will run with your own permissions\n\n"
+    "**Example questions:**\n"
+    "- \"What were our top 10 products last month?\"\n"
+    "- \"Show me sales by region\"\n"
+    "- \"Compare this quarter to last quarter\"\n\n"
+    "Type `/help` for more commands. Let's get started!"
+)
+
+
+# Mapping from VIZ spec chart types to native Adaptive Card Chart elements.
+# Types without a native equivalent (e.g. scatter) fall back to matplotlib.
+NATIVE_CHART_TYPES = {
+    "bar": "Chart.HorizontalBar",
+    "line": "Chart.Line",
+    "area": "Chart.Line",
+    "pie": "Chart.Pie",
+}
+
+
+def create_native_chart_card(
+    viz_spec: Dict[str, str],
+    columns: List[str],
+    data_rows: List[List[Any]],
+    result_id: str,
+    interactive_url: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Create an Adaptive Card with a native Chart element rendered by the Teams client.
+
+    Avoids server-side matplotlib rendering and the ~20KB base64 PNG payload.
+
+    Returns:
+        Card dictionary, or None if the chart type/data cannot be rendered natively
+    """
+    chart_type = viz_spec.get('chart_type', 'bar').lower()
+    native_type = NATIVE_CHART_TYPES.get(chart_type)
+
+    if not native_type:
+        return None
+
+    x_col = viz_spec.get('x_axis', '')
+    y_col = viz_spec.get('y_axis', '')
+
+    if ',' in y_col:
+        y_col = y_col.split(',')[0].strip()
+
+    x_idx = chart_generator._get_column_index(columns, x_col)
+    y_idx = chart_generator._get_column_index(columns, y_col)
+
+    if x_idx is None or y_idx is None:
+        logger.error("Column not found for native chart. x_col=%s, y_col=%s, columns=%s", x_col, y_col, columns)
+        return None
+
+    # Shared vectorized extraction: typed numeric columns take the bulk
+    # astype fast path with no per-row branching or exception handling
+    x_data, y_data = _build_chart_xy(data_rows, x_idx, y_idx)
+
+    if not x_data or not y_data:
+        logger.warning("No valid data for native chart")
+        return None
+
+    title = viz_spec.get('title', 'Query Results')
+
+    if native_type == "Chart.Pie":
+        chart_element = {
+            "type": "Chart.Pie",
+            "colorSet": "categorical",
+            "data": [{"legend": x, "value": y} for x, y in zip(x_data, y_data)]
+        }
+    elif native_type == "Chart.Line":
+        chart_element = {
+            "type": "Chart.Line",
+            "xAxisTitle": viz_spec.get('x_label', x_col),
+            "yAxisTitle": viz_spec.get('y_label', y_col),
+            "data": [{
+                "legend": viz_spec.get('y_label', y_col),
+                "values": [{"x": x, "y": y} for x, y in zip(x_data, y_data)]
+            }]
+        }
+    else:  # Chart.HorizontalBar
+        chart_element = {
+            "type": "Chart.HorizontalBar",
+            "xAxisTitle": viz_spec.get('x_label', x_col),
+            "yAxisTitle": viz_spec.get('y_label', y_col),
+            "data": [{"x": x, "y": y} for x, y in zip(x_data, y_data)]
+        }
+
+    actions = [{
+        "type": "Action.Submit",
+        "title": "View Data Table",
+        "data": {"action": "view_data", "result_id": result_id}
+    }]
+
+    if interactive_url:
+        actions.insert(0, {
+            "type": "Action.OpenUrl",
+            "title": "Open Interactive Chart",
+            "url": interactive_url
+        })
+
+    return {
+        **_CARD_SKELETON,
         "body": [
             {"type": "TextBlock", "text": title, "weight": "Bolder", "size": "Large", "wrap": True},
-            {"type": "Image", "url": image_url, "size": "Stretch", "altText": f"{chart_type.title()} chart: {title}"}
+            chart_element
         ],
         "actions": actions,
-        "msteams": {"width": "Full"}
     }
 
 
@@ -871,7 +1376,7 @@ def create_chart_card(
 # =============================================================================
 
 async def on_error(context: TurnContext, error: Exception):
-    logger.error(f"Unhandled error: {error}")
+    logger.error("Unhandled error: %s", error)
     logger.error(traceback.format_exc())
     await context.send_activity("Oops! Something went wrong. Please try again.")
 
@@ -884,57 +1389,122 @@ ADAPTER.on_turn_error = on_error
 
 class GenieBot:
     """A bot that answers questions using Databricks Genie with user identity (SSO required)."""
-    
+
+    # Eviction caps for the bounded LRU stores below
+    MAX_RESULTS = 50
+    MAX_CHARTS = 100
+    MAX_CACHED_CARDS = 128
+
     def __init__(self):
-        # User session data
-        self.user_conversations: Dict[str, str] = {}  # user_id -> genie_conversation_id
-        self.user_preferences: Dict[str, Dict[str, Any]] = {}
-        self.user_tokens: Dict[str, str] = {}  # user_id -> teams_token (for SSO)
-        
-        # Query results cache
-        self.query_results: Dict[str, Dict[str, Any]] = {}
+        # User session data - TTL-bounded so long-running instances don't
+        # accumulate entries for every user who ever messaged the bot.
+        # Genie conversations and preferences age out after a day of
+        # inactivity; Teams tokens expire upstream within an hour anyway.
+        self.user_conversations: TTLCache = TTLCache(maxsize=10_000, ttl=86_400)  # user_id -> genie_conversation_id
+        self.user_preferences: TTLCache = TTLCache(maxsize=10_000, ttl=86_400)  # user_id -> {pref: value}
+        self.user_tokens: TTLCache = TTLCache(maxsize=10_000, ttl=3_500)  # user_id -> teams_token (for SSO)
+        
+        # Query results cache - LRU via OrderedDict, capped at 50 entries
+        self.query_results: OrderedDict = OrderedDict()
         self._result_counter = 0
-        
-        # Chart images cache
-        self.chart_images: Dict[str, str] = {}
+
+        # Chart images cache (raw PNG bytes, served via /charts/{chart_id}),
+        # LRU via OrderedDict, capped at 100 entries
+        self.chart_images: OrderedDict = OrderedDict()
         self._chart_counter = 0
+
+        # Rendered pagination cards keyed by (result_id, page) - results are
+        # immutable once stored, so Prev/Next clicks reuse the built card.
+        self._card_cache: OrderedDict = OrderedDict()
+        self._card_cache_pages: Dict[str, set] = {}
+
+        # Concurrency guards: on_turn coroutines run concurrently, so the
+        # store counters and per-user conversation state need synchronization
+        self._store_lock = asyncio.Lock()
+        # TTL-bounded like the session maps above - one lock per user must
+        # not accumulate forever; the TTL outlives user_conversations so a
+        # lock never expires while the state it guards is still live
+        self._user_locks: TTLCache = TTLCache(maxsize=10_000, ttl=2 * 86_400)
+
+        # One Genie query per user at a time - a double-tapped Send would
+        # otherwise burn a second executor thread and Databricks query
+        self._inflight_queries: Dict[str, asyncio.Task] = {}
         
         logger.info("GenieBot initialized (SSO-only mode - no Service Principal for queries)")
     
     def _get_user_pref(self, user_id: str, key: str, default: Any = None) -> Any:
-        return self.user_preferences.get(user_id, {}).get(key, default)
+        # Sentinel check avoids allocating an empty dict on the no-prefs path
+        prefs = self.user_preferences.get(user_id)
+        return default if prefs is None else prefs.get(key, default)
     
     def _set_user_pref(self, user_id: str, key: str, value: Any):
         if user_id not in self.user_preferences:
             self.user_preferences[user_id] = {}
         self.user_preferences[user_id][key] = value
     
-    def _store_result(self, result: Dict[str, Any]) -> str:
-        self._result_counter += 1
-        result_id = f"result_{self._result_counter}"
-        self.query_results[result_id] = result
-        
-        if len(self.query_results) > 50:
-            oldest_keys = list(self.query_results.keys())[:-50]
-            for key in oldest_keys:
-                del self.query_results[key]
-        
+    def _get_user_lock(self, user_id: str) -> asyncio.Lock:
+        return self._user_locks.setdefault(user_id, asyncio.Lock())
+
+    async def _store_result(self, result: Dict[str, Any]) -> str:
+        # Case-folded column index, derived once per result instead of once
+        # per chart request against it
+        result['_col_idx'] = {c.lower(): i for i, c in enumerate(result.get('columns', []))}
+
+        async with self._store_lock:
+            self._result_counter += 1
+            result_id = f"result_{self._result_counter}"
+            self.query_results[result_id] = result
+
+            # O(1) eviction of the least recently used entry
+            if len(self.query_results) > self.MAX_RESULTS:
+                evicted_id, _ = self.query_results.popitem(last=False)
+                self._invalidate_cards(evicted_id)
+
         return result_id
-    
-    def store_chart(self, chart_base64: str) -> str:
-        self._chart_counter += 1
-        chart_id = f"chart_{self._chart_counter}"
-        self.chart_images[chart_id] = chart_base64
-        
-        if len(self.chart_images) > 100:
-            oldest_keys = list(self.chart_images.keys())[:-100]
-            for key in oldest_keys:
-                del self.chart_images[key]
-        
+
+    def _get_paginated_card(self, result_id: str, page: int) -> Dict[str, Any]:
+        """Return the card for (result_id, page), building it only on cache miss."""
+        key = (result_id, page)
+        card = self._card_cache.get(key)
+        if card is not None:
+            self._card_cache.move_to_end(key)
+            return card
+
+        card = create_paginated_card(self.query_results[result_id], page=page, result_id=result_id)
+        self._card_cache[key] = card
+        self._card_cache_pages.setdefault(result_id, set()).add(page)
+
+        if len(self._card_cache) > self.MAX_CACHED_CARDS:
+            old_id, old_page = self._card_cache.popitem(last=False)[0]
+            pages = self._card_cache_pages.get(old_id)
+            if pages:
+                pages.discard(old_page)
+                if not pages:
+                    del self._card_cache_pages[old_id]
+
+        return card
+
+    def _invalidate_cards(self, result_id: str):
+        """Drop all cached cards for a result evicted from query_results."""
+        for page in self._card_cache_pages.pop(result_id, ()):
+            self._card_cache.pop((result_id, page), None)
+
+    async def store_chart(self, chart_png: bytes) -> str:
+        async with self._store_lock:
+            self._chart_counter += 1
+            chart_id = f"chart_{self._chart_counter}"
+            self.chart_images[chart_id] = chart_png
+
+            if len(self.chart_images) > self.MAX_CHARTS:
+                self.chart_images.popitem(last=False)
+
         return chart_id
-    
-    def get_chart(self, chart_id: str) -> Optional[str]:
-        return self.chart_images.get(chart_id)
+
+    def get_chart(self, chart_id: str) -> Optional[bytes]:
+        chart = self.chart_images.get(chart_id)
+        if chart is not None:
+            self.chart_images.move_to_end(chart_id)
+        return chart
     
     # =========================================================================
     # SSO Token Handling Methods
@@ -961,8 +1531,6 @@ class GenieBot:
         
         # Try to get token from Bot Framework token service
         try:
-            from botbuilder.core import UserTokenClient
-            
             # Get the token client from the turn context
             token_client = turn_context.turn_state.get("ConnectorClient")
             if token_client:
@@ -976,7 +1544,7 @@ class GenieBot:
                     self.user_tokens[user_id] = token_response.token
                     return token_response.token
         except Exception as e:
-            logger.debug(f"Could not get token from UserTokenClient: {e}")
+            logger.debug("Could not get token from UserTokenClient: %s", e)
         
         return None
     
@@ -995,58 +1563,18 @@ class GenieBot:
             logger.error("TokenManager not initialized - cannot exchange tokens")
             return None
         
-        return TOKEN_MANAGER.exchange_for_databricks_token(user_id, user_token)
-    
-    def _create_signin_card(self) -> Dict[str, Any]:
-        """Create an Adaptive Card prompting user to sign in."""
-        return {
-            "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-            "type": "AdaptiveCard",
-            "version": "1.5",
-            "body": [
-                {
-                    "type": "TextBlock",
-                    "text": "Authentication Required",
-                    "weight": "Bolder",
-                    "size": "Large"
-                },
-                {
-                    "type": "TextBlock",
-                    "text": "Please sign in to access Databricks Genie and query your data.",
-                    "wrap": True
-                },
-                {
-                    "type": "TextBlock",
-                    "text": "Your queries will run with your own identity and permissions.",
-                    "wrap": True,
-                    "size": "Small",
-                    "isSubtle": True
-                }
-            ],
-            "actions": [
-                {
-                    "type": "Action.Submit",
-                    "title": "Sign In",
-                    "data": {"action": "signin"}
-                }
-            ],
-            "msteams": {"width": "Full"}
-        }
+        return await TOKEN_MANAGER.exchange_for_databricks_token(user_id, user_token)
     
     async def _send_signin_card(self, turn_context: TurnContext):
-        """Send a sign-in card to the user."""
-        card = self._create_signin_card()
-        attachment = create_card_attachment(card)
+        """Send the prebuilt sign-in card to the user."""
         await turn_context.send_activity(
-            Activity(type=ActivityTypes.message, attachments=[attachment])
+            Activity(type=ActivityTypes.message, attachments=[SIGNIN_ATTACHMENT])
         )
         logger.info("Sign-in card sent")
     
     async def _trigger_sso_signin(self, turn_context: TurnContext):
         """Trigger the SSO sign-in flow by sending an OAuthCard."""
-        from botbuilder.schema import OAuthCard, CardAction
-        
-        logger.info(f"Sending OAuthCard for connection: {SSO_CONNECTION_NAME}")
+        logger.info("Sending OAuthCard for connection: %s", SSO_CONNECTION_NAME)
         
         oauth_card = OAuthCard(
             text="Please sign in to continue",
@@ -1089,73 +1617,63 @@ class GenieBot:
     async def on_turn(self, turn_context: TurnContext):
         activity = turn_context.activity
         sender_id = activity.from_property.id if activity.from_property else "Unknown"
-        
-        logger.info(f"Activity Type: {activity.type}, From: {sender_id}")
-        
-        # Log invoke details
-        if activity.type == ActivityTypes.invoke:
-            logger.info(f"Invoke Name: {activity.name}, Value: {activity.value}")
-        
-        if activity.type == ActivityTypes.invoke:
-            await self._handle_invoke(turn_context)
+
+        logger.info("Activity Type: %s, From: %s", activity.type, sender_id)
+
+        # Dispatch on activity type (table defined after the handlers below)
+        handler = self._TURN_DISPATCH.get(activity.type)
+        if handler:
+            await handler(self, turn_context)
+
+    async def _on_message_activity(self, turn_context: TurnContext):
+        activity = turn_context.activity
+        if activity.value and not activity.text:
+            await self._handle_card_action(turn_context, activity.value)
             return
-        
-        if activity.type == ActivityTypes.message:
-            if activity.value and not activity.text:
-                await self._handle_card_action(turn_context, activity.value)
-                return
-            await self._handle_message(turn_context, sender_id, activity.text)
-        
-        elif activity.type == ActivityTypes.conversation_update:
-            await self._handle_conversation_update(turn_context, activity)
-    
+        sender_id = activity.from_property.id if activity.from_property else "Unknown"
+        await self._handle_message(turn_context, sender_id, activity.text)
+
+    async def _on_conversation_update_activity(self, turn_context: TurnContext):
+        await self._handle_conversation_update(turn_context, turn_context.activity)
+
     async def _handle_invoke(self, turn_context: TurnContext):
         activity = turn_context.activity
         value = activity.value or {}
         invoke_name = activity.name
-        
-        logger.info(f"Handling invoke: name={invoke_name}, value={value}")
-        
-        # Handle SSO token exchange
-        if invoke_name == "signin/tokenExchange":
-            await self._handle_token_exchange(turn_context, value)
-            return
-        
-        if invoke_name == "task/fetch":
-            await self._handle_task_fetch(turn_context, value)
-            return
-        
-        if invoke_name == "task/submit":
-            await turn_context.send_activity(
-                Activity(type=ActivityTypes.invoke_response, value=InvokeResponse(status=200, body={}))
-            )
-            return
-        
-        action = value.get("action")
-        
-        if action == "pagination":
-            await self._handle_pagination(turn_context, value)
-        elif action == "view_data":
-            await self._handle_view_data(turn_context, value)
+
+        logger.info("Handling invoke: name=%s, value=%s", invoke_name, value)
+
+        handler = self._INVOKE_DISPATCH.get(invoke_name)
+        if handler is None:
+            # Invokes carrying a card action payload (pagination / view_data)
+            handler = self._ACTION_HANDLERS.get(value.get("action"))
+
+        if handler:
+            await handler(self, turn_context, value)
         else:
             await turn_context.send_activity(
                 Activity(type=ActivityTypes.invoke_response, value=InvokeResponse(status=200))
             )
+
+    async def _handle_task_submit(self, turn_context: TurnContext, value: Dict[str, Any]):
+        await turn_context.send_activity(
+            Activity(type=ActivityTypes.invoke_response, value=InvokeResponse(status=200, body={}))
+        )
     
     async def _handle_token_exchange(self, turn_context: TurnContext, value: Dict[str, Any]):
         """Handle the signin/tokenExchange invoke from Teams SSO."""
         user_id = turn_context.activity.from_property.id if turn_context.activity.from_property else None
         token = value.get("token")
         
-        logger.info(f"=== TOKEN EXCHANGE RECEIVED ===")
-        logger.info(f"User ID: {user_id}")
-        logger.info(f"Token present: {bool(token)}")
-        logger.info(f"Value keys: {list(value.keys())}")
+        logger.info("=== TOKEN EXCHANGE RECEIVED ===")
+        logger.info("User ID: %s", user_id)
+        logger.info("Token present: %s", bool(token))
+        logger.info("Value keys: %s", list(value.keys()))
         
         if token and user_id:
             # Store the token for this user
             self.user_tokens[user_id] = token
-            logger.info(f"Token stored for user {user_id}")
+            logger.info("Token stored for user %s", user_id)
             
             # Send success response - MUST use InvokeResponse object
             await turn_context.send_activity(
@@ -1170,7 +1688,7 @@ class GenieBot:
                 "You're now signed in. Ask me anything about your data!"
             )
         else:
-            logger.warning(f"Token exchange failed - no token received")
+            logger.warning("Token exchange failed - no token received")
             await turn_context.send_activity(
                 Activity(
                     type=ActivityTypes.invoke_response,
@@ -1179,25 +1697,22 @@ class GenieBot:
             )
     
     async def _handle_card_action(self, turn_context: TurnContext, value: Dict[str, Any]):
-        action = value.get("action")
-        
-        if action == "signin":
-            # User clicked Sign In button - send OAuthCard to trigger SSO
-            logger.info("User clicked signin action, sending OAuthCard")
-            await self._trigger_sso_signin(turn_context)
-            return
-        elif action == "pagination":
-            await self._handle_pagination(turn_context, value)
-        elif action == "view_data":
-            await self._handle_view_data(turn_context, value)
+        handler = self._CARD_ACTION_DISPATCH.get(value.get("action"))
+        if handler:
+            await handler(self, turn_context, value)
+
+    async def _handle_signin_action(self, turn_context: TurnContext, value: Dict[str, Any]):
+        # User clicked Sign In button - send OAuthCard to trigger SSO
+        logger.info("User clicked signin action, sending OAuthCard")
+        await self._trigger_sso_signin(turn_context)
     
     async def _handle_pagination(self, turn_context: TurnContext, value: Dict[str, Any]):
         result_id = value.get("result_id")
         page = value.get("page", 0)
         
         if result_id and result_id in self.query_results:
-            result = self.query_results[result_id]
-            card = create_paginated_card(result, page=page, result_id=result_id)
+            self.query_results.move_to_end(result_id)  # keep active results alive
+            card = self._get_paginated_card(result_id, page)
             attachment = create_card_attachment(card)
             await turn_context.send_activity(Activity(type=ActivityTypes.message, attachments=[attachment]))
         else:
@@ -1207,8 +1722,8 @@ class GenieBot:
         result_id = value.get("result_id")
         
         if result_id and result_id in self.query_results:
-            result = self.query_results[result_id]
-            card = create_paginated_card(result, page=0, result_id=result_id)
+            self.query_results.move_to_end(result_id)
+            card = self._get_paginated_card(result_id, 0)
             attachment = create_card_attachment(card)
             await turn_context.send_activity(Activity(type=ActivityTypes.message, attachments=[attachment]))
         else:
@@ -1228,8 +1743,108 @@ class GenieBot:
         await turn_context.send_activity(
             Activity(type=ActivityTypes.invoke_response, value=InvokeResponse(status=200, body=response))
         )
+
+    # Routing tables (same pattern as _COMMANDS): O(1) lookup instead of
+    # if/elif chains, and the full set of handled cases is visible in one place.
+    _TURN_DISPATCH = {
+        ActivityTypes.invoke: _handle_invoke,
+        ActivityTypes.message: _on_message_activity,
+        ActivityTypes.conversation_update: _on_conversation_update_activity,
+    }
+
+    _INVOKE_DISPATCH = {
+        "signin/tokenExchange": _handle_token_exchange,
+        "task/fetch": _handle_task_fetch,
+        "task/submit": _handle_task_submit,
+    }
+
+    _ACTION_HANDLERS = {
+        "pagination": _handle_pagination,
+        "view_data": _handle_view_data,
+    }
+
+    # Card actions accept everything an invoke action does, plus signin
+    _CARD_ACTION_DISPATCH = {"signin": _handle_signin_action, **_ACTION_HANDLERS}
     
+    # =========================================================================
+    # Command Handlers
+    # =========================================================================
+
+    async def _cmd_reset(self, turn_context: TurnContext, user_id: str):
+        self.user_conversations.pop(user_id, None)
+        await turn_context.send_activity("**New conversation started!**\n\nAsk me anything about your data.")
+
+    async def _cmd_sql_on(self, turn_context: TurnContext, user_id: str):
+        self._set_user_pref(user_id, "show_sql", True)
+        await turn_context.send_activity("**SQL display is now ON.** Generated SQL queries will be shown.")
+
+    async def _cmd_sql_off(self, turn_context: TurnContext, user_id: str):
+        self._set_user_pref(user_id, "show_sql", False)
+        await turn_context.send_activity("**SQL display is now OFF.** SQL queries will be hidden.")
+
+    async def _cmd_help(self, turn_context: TurnContext, user_id: str):
+        show_sql = self._get_user_pref(user_id, "show_sql", True)
+        sql_status = "ON" if show_sql else "OFF"
+        await turn_context.send_activity(
+            "**Databricks Genie Bot Help**\n\n"
+            "I can answer questions about your data using natural language.\n\n"
+            "**Commands:**\n"
+            "- Just type your question to ask about your data\n"
+            "- `/new` or `/reset` - Start a new conversation\n"
+            "- `/sql on` - Show generated SQL queries\n"
+            "- `/sql off` - Hide generated SQL queries\n"
+            "- `/help` - Show this help message\n\n"
+            f"**Current Settings:** SQL display is **{sql_status}**\n\n"
+            "**Tips:**\n"
+            "- Ask follow-up questions to refine your results\n"
+            "- Be specific about time periods, metrics, and filters"
+        )
+
+    async def _cmd_signout(self, turn_context: TurnContext, user_id: str):
+        self.user_tokens.pop(user_id, None)
+        if TOKEN_MANAGER:
+            TOKEN_MANAGER.clear_user_token(user_id)
+        self.user_conversations.pop(user_id, None)
+        await turn_context.send_activity("**Signed out successfully.**\n\nYou'll need to sign in again to continue.")
+
+    # Normalized message text -> handler; one hash probe replaces the old
+    # chain of `message.lower().strip() == ...` branches
+    _COMMANDS = {
+        "/new": _cmd_reset,
+        "/reset": _cmd_reset,
+        "new conversation": _cmd_reset,
+        "start over": _cmd_reset,
+        "/sql on": _cmd_sql_on,
+        "/sql off": _cmd_sql_off,
+        "/help": _cmd_help,
+        "help": _cmd_help,
+        "/signout": _cmd_signout,
+        "/logout": _cmd_signout,
+    }
+
     async def _handle_message(self, turn_context: TurnContext, user_id: str, message: str):
+        # Reject duplicate submissions and claim the in-flight slot before the
+        # first await - checking later (after the token exchange and typing
+        # round trips) left a window where a double-tapped Send passed the
+        # check twice and fired two Genie RPCs
+        prev = self._inflight_queries.get(user_id)
+        if prev and not prev.done():
+            await turn_context.send_activity(
+                "Still working on your previous question - please wait for that answer first."
+            )
+            return
+
+        marker = asyncio.get_running_loop().create_future()
+        self._inflight_queries[user_id] = marker
+        try:
+            await self._process_message(turn_context, user_id, message)
+        finally:
+            marker.cancel()
+            # Only this turn holds the user's slot (duplicates returned above),
+            # so this also clears the query task that may have replaced the marker
+            self._inflight_queries.pop(user_id, None)
+
+    async def _process_message(self, turn_context: TurnContext, user_id: str, message: str):
         # =====================================================================
         # SSO Authentication Required
         # =====================================================================
@@ -1239,7 +1854,7 @@ class GenieBot:
         
         if not user_token:
             # No token - show sign-in card
-            logger.info(f"No token for user {user_id}, sending sign-in card")
+            logger.info("No token for user %s, sending sign-in card", user_id)
             await self._send_signin_card(turn_context)
             return
         
@@ -1247,7 +1862,7 @@ class GenieBot:
         databricks_token = await self._exchange_for_databricks_token(user_id, user_token)
         
         if not databricks_token:
-            logger.error(f"Failed to get Databricks token for user {user_id}")
+            logger.error("Failed to get Databricks token for user %s", user_id)
             await turn_context.send_activity(
                 "**Authentication Error**\n\n"
                 "Failed to authenticate with Databricks. Please try signing in again."
@@ -1262,78 +1877,48 @@ class GenieBot:
         # =====================================================================
         # Handle Commands (these don't need Genie)
         # =====================================================================
-        
-        # Command: /new or /reset
-        if message and message.lower().strip() in ["/new", "/reset", "new conversation", "start over"]:
-            self.user_conversations.pop(user_id, None)
-            await turn_context.send_activity("**New conversation started!**\n\nAsk me anything about your data.")
-            return
-        
-        # Command: /sql on
-        if message and message.lower().strip() == "/sql on":
-            self._set_user_pref(user_id, "show_sql", True)
-            await turn_context.send_activity("**SQL display is now ON.** Generated SQL queries will be shown.")
-            return
-        
-        # Command: /sql off
-        if message and message.lower().strip() == "/sql off":
-            self._set_user_pref(user_id, "show_sql", False)
-            await turn_context.send_activity("**SQL display is now OFF.** SQL queries will be hidden.")
-            return
-        
-        # Command: /help
-        if message and message.lower().strip() in ["/help", "help"]:
-            show_sql = self._get_user_pref(user_id, "show_sql", True)
-            sql_status = "ON" if show_sql else "OFF"
-            await turn_context.send_activity(
-                "**Databricks Genie Bot Help**\n\n"
-                "I can answer questions about your data using natural language.\n\n"
-                "**Commands:**\n"
-                "- Just type your question to ask about your data\n"
-                "- `/new` or `/reset` - Start a new conversation\n"
-                "- `/sql on` - Show generated SQL queries\n"
-                "- `/sql off` - Hide generated SQL queries\n"
-                "- `/help` - Show this help message\n\n"
-                f"**Current Settings:** SQL display is **{sql_status}**\n\n"
-                "**Tips:**\n"
-                "- Ask follow-up questions to refine your results\n"
-                "- Be specific about time periods, metrics, and filters"
-            )
-            return
-        
-        # Command: /signout
-        if message and message.lower().strip() in ["/signout", "/logout"]:
-            self.user_tokens.pop(user_id, None)
-            if TOKEN_MANAGER:
-                TOKEN_MANAGER.clear_user_token(user_id)
-            self.user_conversations.pop(user_id, None)
-            await turn_context.send_activity("**Signed out successfully.**\n\nYou'll need to sign in again to continue.")
+
+        # Normalize once, dispatch with a single dict probe
+        command = message.lower().strip() if message else ""
+        handler = self._COMMANDS.get(command)
+        if handler:
+            await handler(self, turn_context, user_id)
             return
-        
+
         # =====================================================================
         # Process Query with User's Identity
         # =====================================================================
-        
+
+        # Read the preference once per message rather than per branch
+        show_sql = self._get_user_pref(user_id, "show_sql", True)
+
         # Send typing indicator
         await turn_context.send_activity(Activity(type=ActivityTypes.typing))
         
         # Create GenieClient with user's Databricks token
         genie_client = self._create_genie_client(databricks_token)
         
-        genie_conversation_id = self.user_conversations.get(user_id)
-        
+        user_lock = self._get_user_lock(user_id)
+        async with user_lock:
+            genie_conversation_id = self.user_conversations.get(user_id)
+
         try:
-            loop = asyncio.get_event_loop()
-            
             if genie_conversation_id:
-                logger.info(f"Follow-up for user {user_id} in conversation {genie_conversation_id}")
-                result = await loop.run_in_executor(None, genie_client.follow_up, genie_conversation_id, message)
+                logger.info("Follow-up for user %s in conversation %s", user_id, genie_conversation_id)
+                query = genie_client.follow_up(genie_conversation_id, message)
             else:
-                logger.info(f"Starting new Genie conversation for user {user_id}")
-                result = await loop.run_in_executor(None, genie_client.ask_question, message)
-            
+                logger.info("Starting new Genie conversation for user %s", user_id)
+                query = genie_client.ask_question(message)
+
+            # Swap the turn marker for the actual query task so a future
+            # handler could cancel it; _handle_message's finally owns cleanup
+            query_task = asyncio.ensure_future(query)
+            self._inflight_queries[user_id] = query_task
+            result = await query_task
+
             if result.get("conversation_id") and not result.get("error"):
-                self.user_conversations[user_id] = result["conversation_id"]
+                async with user_lock:
+                    self.user_conversations[user_id] = result["conversation_id"]
             
             # Parse visualization spec
             raw_text = result.get('text', '')
@@ -1341,17 +1926,22 @@ class GenieBot:
             result['text'] = clean_text
             
             if viz_spec:
-                logger.info(f"VIZ spec found: {viz_spec}")
+                logger.info("VIZ spec found: %s", viz_spec)
             
             # Store result for pagination
             result_id = None
             if result.get("data_rows") and result.get("columns"):
                 if viz_spec:
                     result['viz_spec'] = viz_spec
-                result_id = self._store_result(result)
-                logger.info(f"Stored result {result_id} with {len(result['data_rows'])} rows")
+                result_id = await self._store_result(result)
+                logger.info("Stored result %s with %d rows", result_id, len(result['data_rows']))
             
-            # Send text response
+            # Collect outbound activities and flush them in one batched
+            # send_activities call - each send_activity is its own HTTPS
+            # round trip to the connector service
+            outgoing: List[Activity] = []
+
+            # Text response
             if clean_text or result.get("suggested_questions"):
                 text_response = clean_text if clean_text else ""
                 
@@ -1362,18 +1952,34 @@ class GenieBot:
                         text_response += f"\n{i}. {question}"
                 
                 # Add SQL if user wants it
-                show_sql = self._get_user_pref(user_id, "show_sql", True)
                 if show_sql and result.get("sql"):
                     text_response += f"\n\n---\n**Generated SQL:**\n```sql\n{result['sql']}\n```"
                 
                 if text_response.strip():
-                    await turn_context.send_activity(Activity(type=ActivityTypes.message, text=text_response))
+                    outgoing.append(Activity(type=ActivityTypes.message, text=text_response))
             
-            # Generate and send chart
+            # Generate the chart card
             chart_generated = False
             if viz_spec and result.get("data_rows") and result.get("columns") and result_id:
-                logger.info(f"Generating chart: type={viz_spec.get('chart_type')}")
-                
+                logger.info("Generating chart: type=%s", viz_spec.get('chart_type'))
+                interactive_url = f"{BOT_PUBLIC_URL}/interactive-chart/{result_id}"
+
+                # Prefer native client-side rendering - no matplotlib, no PNG payload
+                if USE_NATIVE_CHARTS:
+                    native_card = create_native_chart_card(
+                        viz_spec=viz_spec,
+                        columns=result["columns"],
+                        data_rows=result["data_rows"],
+                        result_id=result_id,
+                        interactive_url=interactive_url
+                    )
+                    if native_card:
+                        attachment = create_card_attachment(native_card)
+                        outgoing.append(Activity(type=ActivityTypes.message, attachments=[attachment]))
+                        chart_generated = True
+
+            # Fall back to server-side matplotlib rendering
+            if not chart_generated and viz_spec and result.get("data_rows") and result.get("columns") and result_id:
                 chart_image = chart_generator.generate(
                     viz_spec=viz_spec,
                     columns=result["columns"],
@@ -1381,39 +1987,48 @@ class GenieBot:
                 )
                 
                 if chart_image:
-                    logger.info(f"Chart generated, base64 size: {len(chart_image)} chars")
-                    
+                    logger.info("Chart generated, PNG size: %d bytes", len(chart_image))
+
+                    chart_id = await self.store_chart(chart_image)
                     chart_title = viz_spec.get('title', 'Query Results')
                     chart_type = viz_spec.get('chart_type', 'bar')
-                    interactive_url = f"{BOT_PUBLIC_URL}/interactive-chart/{result_id}"
-                    
+
                     chart_card = create_chart_card(
-                        chart_image_base64=chart_image,
+                        chart_url=f"{BOT_PUBLIC_URL}/charts/{chart_id}",
                         title=chart_title,
                         result_id=result_id,
                         chart_type=chart_type,
                         interactive_url=interactive_url
                     )
                     attachment = create_card_attachment(chart_card)
-                    
-                    await turn_context.send_activity(Activity(type=ActivityTypes.message, attachments=[attachment]))
+                    outgoing.append(Activity(type=ActivityTypes.message, attachments=[attachment]))
                     chart_generated = True
                 else:
                     logger.warning("Chart generation failed")
-                    await turn_context.send_activity("_Note: Could not generate chart. Showing data table instead._")
+                    outgoing.append(Activity(
+                        type=ActivityTypes.message,
+                        text="_Note: Could not generate chart. Showing data table instead._"
+                    ))
             
             # Show data table if no chart
             if not chart_generated and result.get("data_rows") and result.get("columns") and result_id:
                 card = create_paginated_card(result, page=0, result_id=result_id)
                 attachment = create_card_attachment(card)
-                await turn_context.send_activity(Activity(type=ActivityTypes.message, attachments=[attachment]))
-            elif not result.get("text") and not result.get("data_rows"):
-                await turn_context.send_activity("I processed your question but didn't find any results.")
+                outgoing.append(Activity(type=ActivityTypes.message, attachments=[attachment]))
+            elif not result.get("text") and not result.get("data_rows") and not outgoing:
+                outgoing.append(Activity(
+                    type=ActivityTypes.message,
+                    text="I processed your question but didn't find any results."
+                ))
+            
+            # One connector round trip for the whole response
+            if outgoing:
+                await turn_context.send_activities(outgoing)
             
             logger.info("Response sent to user")
             
         except Exception as e:
-            logger.error(f"Error processing message: {e}")
+            logger.error("Error processing message: %s", e)
             logger.error(traceback.format_exc())
             await turn_context.send_activity(f"**Error**\n\nSorry, I encountered an error: {str(e)}")
     
@@ -1421,21 +2036,8 @@ class GenieBot:
         if activity.members_added:
             for member in activity.members_added:
                 if member.id != activity.recipient.id:
-                    welcome_text = (
-                        "**Welcome to Databricks Genie Bot!**\n\n"
-                        "I can help you explore and analyze your data using natural language.\n\n"
-                        "**Getting Started:**\n"
-                        "1. Send any message to begin\n"
-                        "2. You'll be asked to sign in (one-time)\n"
-                        "3. Your queries will run with your own permissions\n\n"
-                        "**Example questions:**\n"
-                        "- \"What were our top 10 products last month?\"\n"
-                        "- \"Show me sales by region\"\n"
-                        "- \"Compare this quarter to last quarter\"\n\n"
-                        "Type `/help` for more commands. Let's get started!"
-                    )
-                    await turn_context.send_activity(welcome_text)
-                    logger.info(f"Welcome message sent to: {member.name if member.name else member.id}")
+                    await turn_context.send_activity(WELCOME_TEXT)
+                    logger.info("Welcome message sent to: %s", member.name if member.name else member.id)
 
 
 # =============================================================================
@@ -1449,35 +2051,93 @@ BOT = GenieBot()
 # Web Server Endpoints
 # =============================================================================
 
+# Never preallocate more than aiohttp's default client_max_size - the header
+# is attacker-controlled, so oversized claims take the limit-enforcing path
+_MAX_PREALLOC_BODY = 1024 ** 2
+
+
+async def _read_json_body(req: Request) -> Any:
+    """Read and parse the request body via a Content-Length-sized buffer.
+
+    Preallocating the buffer avoids the repeated bytearray regrowth of the
+    default accumulate-then-join read path on large activity payloads
+    (e.g. card submits with attachments).
+    """
+    try:
+        length = int(req.headers.get("Content-Length", "0"))
+    except ValueError:
+        length = 0
+
+    if length <= 0 or length > _MAX_PREALLOC_BODY:
+        # Chunked, missing or oversized Content-Length - fall back to
+        # req.read(), which enforces client_max_size (413 when exceeded)
+        return orjson.loads(await req.read())
+
+    buf = bytearray(length)
+    view = memoryview(buf)
+    offset = 0
+    while offset < length:
+        chunk = await req.content.readany()
+        if not chunk:
+            break
+        view[offset:offset + len(chunk)] = chunk
+        offset += len(chunk)
+
+    return orjson.loads(view[:offset] if offset != length else buf)
+
+
+# Classmethod resolved once instead of per request - already bound to the
+# class, so it takes the payload dict directly
+_deserialize_activity = Activity.deserialize
+
+
+# Response-body serializers keyed by concrete type. Botbuilder response types
+# are registered lazily the first time one is seen, so the steady-state path
+# is a single dict lookup with no hasattr walk.
+_SERIALIZERS: Dict[type, Any] = {
+    dict: orjson.dumps,
+    list: orjson.dumps,
+}
+
+
+def _serialize_body(body: Any) -> bytes:
+    serializer = _SERIALIZERS.get(type(body))
+    if serializer is None:
+        if hasattr(body, 'serialize'):
+            serializer = lambda o: orjson.dumps(o.serialize())
+        else:
+            serializer = lambda o: orjson.dumps(o.__dict__)
+        _SERIALIZERS[type(body)] = serializer
+    return serializer(body)
+
+
 async def messages(req: Request) -> Response:
     """Main bot message endpoint."""
-    if "application/json" in req.headers.get("Content-Type", ""):
-        body = await req.json()
-    else:
+    # Prefix check instead of a substring scan over "application/json; charset=..."
+    if not req.headers.get("Content-Type", "").startswith("application/json"):
         return Response(status=415)
 
-    activity = Activity().deserialize(body)
+    # Body is read into a presized buffer and parsed exactly once (orjson)
+    body = await _read_json_body(req)
+
+    activity = _deserialize_activity(body)
     auth_header = req.headers.get("Authorization", "")
 
     response = await ADAPTER.process_activity(activity, auth_header, BOT.on_turn)
     
     if response:
-        # Handle response body - serialize if it's an object
         body = response.body
-        if body is not None and not isinstance(body, (str, bytes)):
-            import json
-            try:
-                # Try to serialize the object
-                if hasattr(body, 'serialize'):
-                    body = json.dumps(body.serialize())
-                elif hasattr(body, '__dict__'):
-                    body = json.dumps(body.__dict__)
-                else:
-                    body = str(body)
-            except Exception as e:
-                logger.warning(f"Could not serialize response body: {e}")
-                body = None
-        return Response(status=response.status, body=body)
+        if body is None or isinstance(body, (str, bytes)):
+            return Response(status=response.status, body=body)
+
+        # Object bodies (invoke responses etc.) go out as proper JSON -
+        # one type-keyed dict lookup picks the serializer
+        try:
+            payload = _serialize_body(body)
+        except Exception as e:
+            logger.warning("Could not serialize response body: %s", e)
+            return Response(status=response.status)
+        return Response(status=response.status, body=payload, content_type="application/json")
     return Response(status=201)
 
 
@@ -1493,6 +2153,10 @@ async def health(req: Request) -> Response:
 # Interactive Chart Template (Plotly.js)
 # =============================================================================
 
+# Pinned Plotly bundle - referenced by the template and preloaded via a Link
+# header while the page streams
+_PLOTLY_CDN = "https://cdn.plot.ly/plotly-2.27.0.min.js"
+
 INTERACTIVE_CHART_TEMPLATE = '''
 <!DOCTYPE html>
 <html lang="en">
@@ -1564,6 +2228,47 @@ INTERACTIVE_CHART_TEMPLATE = '''
 </html>
 '''
 
+# Pre-split the template once at import time - str.format would re-parse every
+# {...} placeholder (and un-escape every {{...}}) of the ~4KB template on each
+# request. Even indices of _TEMPLATE_PARTS are literal chunks with the brace
+# escaping already resolved; odd indices are field names to substitute.
+_TEMPLATE_FIELDS = ("title", "chart_data_json", "colors_json", "chart_type", "x_label", "y_label")
+_TEMPLATE_PARTS = [
+    token.replace("{{", "{").replace("}}", "}") if i % 2 == 0 else token
+    for i, token in enumerate(
+        re.split(r"\{(" + "|".join(_TEMPLATE_FIELDS) + r")\}", INTERACTIVE_CHART_TEMPLATE)
+    )
+]
+
+
+# Literal chunks pre-encoded once - the streaming writer sends them verbatim
+_TEMPLATE_PARTS_BYTES = [
+    part.encode("utf-8") if i % 2 == 0 else part
+    for i, part in enumerate(_TEMPLATE_PARTS)
+]
+
+
+async def _stream_interactive_chart(req: Request, values: Dict[str, bytes]) -> web.StreamResponse:
+    """Stream the interactive chart page from pre-split template parts.
+
+    Bytes hit the socket as they are written, so the head, the (potentially
+    multi-megabyte) chart data chunk and the tail never sit concatenated in
+    memory at once.
+    """
+    resp = web.StreamResponse(status=200, headers={
+        "Content-Type": "text/html; charset=utf-8",
+        # Let the browser start fetching Plotly while the page is streaming
+        "Link": f"<{_PLOTLY_CDN}>; rel=preload; as=script",
+    })
+    # Negotiated against Accept-Encoding at prepare time; the page is ~70%
+    # repetitive markup/JSON, so deflate cuts most of the bytes on the wire
+    resp.enable_compression()
+    await resp.prepare(req)
+    for i, part in enumerate(_TEMPLATE_PARTS_BYTES):
+        await resp.write(part if i % 2 == 0 else values[part])
+    await resp.write_eof()
+    return resp
+
 
 async def serve_chart(req: Request) -> Response:
     """Serve chart images by ID."""
@@ -1572,20 +2277,40 @@ async def serve_chart(req: Request) -> Response:
     if not chart_id:
         return Response(status=400, text="Missing chart_id")
     
-    chart_base64 = BOT.get_chart(chart_id)
-    
-    if not chart_base64:
+    chart_png = BOT.get_chart(chart_id)
+
+    if not chart_png:
         return Response(status=404, text="Chart not found")
-    
-    try:
-        chart_binary = base64.b64decode(chart_base64)
-        return Response(status=200, body=chart_binary, content_type="image/png", headers={"Cache-Control": "public, max-age=3600"})
-    except Exception as e:
-        logger.error(f"Error serving chart {chart_id}: {e}")
-        return Response(status=500, text="Error serving chart")
 
+    # Charts are immutable once stored, so tell clients never to re-ask and
+    # answer conditional GETs without shipping the body again
+    etag = f'"{chart_id}"'
+    headers = {"Cache-Control": "public, max-age=86400, immutable", "ETag": etag}
 
-async def interactive_chart(req: Request) -> Response:
+    if req.headers.get("If-None-Match") == etag:
+        return Response(status=304, headers=headers)
+
+    # PNG bytes are stored as-is - no base64 decode on the request path
+    return Response(status=200, body=chart_png, content_type="image/png", headers=headers)
+
+
+def _build_chart_xy(data_rows: List[List[Any]], x_idx: int, y_idx: int) -> Tuple[List[str], List[float]]:
+    """Vectorized x/y column extraction - same tiers as ChartGenerator's chart path."""
+    arr = np.asarray(data_rows, dtype=object)
+    if arr.ndim == 2:
+        x_col = arr[:, x_idx]
+        mask = np.array([v is not None for v in x_col])
+        x_data = x_col[mask].astype(str).tolist()
+        y_data = np.nan_to_num(chart_generator._to_numeric_array(arr[mask, y_idx])).tolist()
+        return x_data, y_data
+
+    # Ragged rows - fall back to the plain Python path
+    x_data = [str(row[x_idx]) for row in data_rows if row[x_idx] is not None]
+    y_data = [chart_generator._to_numeric(row[y_idx]) for row in data_rows if row[x_idx] is not None]
+    return x_data, y_data
+
+
+async def interactive_chart(req: Request) -> web.StreamResponse:
     """Serve interactive chart page using Plotly.js."""
     result_id = req.match_info.get('result_id', '')
     
@@ -1610,35 +2335,56 @@ async def interactive_chart(req: Request) -> Response:
     if ',' in y_col:
         y_col = y_col.split(',')[0].strip()
     
-    x_idx = next((i for i, c in enumerate(columns) if c.lower() == x_col.lower()), 0)
-    y_idx = next((i for i, c in enumerate(columns) if c.lower() == y_col.lower()), 1 if len(columns) > 1 else 0)
-    
-    x_data = [str(row[x_idx]) for row in data_rows if row[x_idx] is not None]
-    y_data = []
-    for row in data_rows:
-        if row[x_idx] is not None:
-            try:
-                val = row[y_idx]
-                if isinstance(val, (int, float)):
-                    y_data.append(float(val))
-                else:
-                    cleaned = re.sub(r'[$,€£%]', '', str(val))
-                    y_data.append(float(cleaned))
-            except (ValueError, TypeError):
-                y_data.append(0)
-    
+    # Lowercase->index dict, normally prebuilt once when the result was stored
+    col_idx = result.get('_col_idx')
+    if col_idx is None:
+        col_idx = {c.lower(): i for i, c in enumerate(columns)}
+    x_idx = col_idx.get(x_col.lower(), 0)
+    y_idx = col_idx.get(y_col.lower(), 1 if len(columns) > 1 else 0)
+    
+    # Shaping a big result can take tens of ms - run it off-loop so other
+    # bot turns keep being served; small payloads stay inline since the
+    # executor hop costs more than the work itself
+    if len(data_rows) > 2000:
+        loop = asyncio.get_running_loop()
+        x_data, y_data = await loop.run_in_executor(None, _build_chart_xy, data_rows, x_idx, y_idx)
+    else:
+        x_data, y_data = _build_chart_xy(data_rows, x_idx, y_idx)
+
     chart_data = {'x': x_data, 'y': y_data}
-    
-    html = INTERACTIVE_CHART_TEMPLATE.format(
-        title=viz_spec.get('title', 'Query Results'),
-        chart_data_json=json.dumps(chart_data),
-        colors_json=json.dumps(CHART_COLORS),
-        chart_type=viz_spec.get('chart_type', 'bar'),
-        x_label=viz_spec.get('x_label', x_col),
-        y_label=viz_spec.get('y_label', y_col)
+
+    # orjson emits bytes, which stream straight to the socket un-decoded
+    return await _stream_interactive_chart(req, {
+        "title": viz_spec.get('title', 'Query Results').encode("utf-8"),
+        "chart_data_json": orjson.dumps(chart_data),
+        "colors_json": COLORS_JSON,
+        "chart_type": viz_spec.get('chart_type', 'bar').encode("utf-8"),
+        "x_label": viz_spec.get('x_label', x_col).encode("utf-8"),
+        "y_label": viz_spec.get('y_label', y_col).encode("utf-8"),
+    })
+
+
+async def serve_result_csv(req: Request) -> Response:
+    """Serve a stored query result as a CSV download."""
+    result_id = req.match_info.get('result_id', '')
+
+    result = BOT.query_results.get(result_id) if result_id else None
+
+    if not result:
+        return Response(status=404, text="Result not found. The data may have expired - please run the query again.")
+
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(result.get("columns", []))
+    writer.writerows(result.get("data_rows", []))
+
+    # utf-8-sig so Excel picks up the encoding when the file is opened directly
+    return Response(
+        status=200,
+        body=buf.getvalue().encode("utf-8-sig"),
+        content_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{result_id}.csv"'}
     )
-    
-    return Response(status=200, text=html, content_type="text/html")
 
 
 def init_app():
@@ -1649,6 +2395,7 @@ def init_app():
     app.router.add_get("/", health)
     app.router.add_get("/charts/{chart_id}", serve_chart)
     app.router.add_get("/interactive-chart/{result_id}", interactive_chart)
+    app.router.add_get("/results/{result_id}.csv", serve_result_csv)
     return app
 
 
@@ -1659,16 +2406,31 @@ def init_app():
 if __name__ == "__main__":
     APP = init_app()
     
-    print("=" * 60)
-    print("Databricks Genie Bot Starting (Azure App Service)...")
-    print("=" * 60)
-    print(f"Port: {PORT}")
-    print(f"Bot endpoint: /api/messages")
-    print(f"Health check: /health")
-    print(f"Databricks Host: {DATABRICKS_HOST}")
-    print(f"Genie Space ID: {GENIE_SPACE_ID}")
-    print(f"Service Principal configured: {'Yes' if DATABRICKS_CLIENT_ID else 'NO'}")
-    print(f"Bot Public URL: {BOT_PUBLIC_URL}")
-    print("=" * 60)
-    
-    web.run_app(APP, host="0.0.0.0", port=PORT)
+    # One buffered write instead of ~10 print calls (one syscall on cold start)
+    sys.stdout.write("\n".join([
+        "=" * 60,
+        "Databricks Genie Bot Starting (Azure App Service)...",
+        "=" * 60,
+        f"Port: {PORT}",
+        "Bot endpoint: /api/messages",
+        "Health check: /health",
+        f"Databricks Host: {DATABRICKS_HOST}",
+        f"Genie Space ID: {GENIE_SPACE_ID}",
+        f"Service Principal configured: {'Yes' if DATABRICKS_CLIENT_ID else 'NO'}",
+        f"Bot Public URL: {BOT_PUBLIC_URL}",
+        "=" * 60,
+    ]) + "\n")
+    sys.stdout.flush()
+
+    # App Service captures stdout anyway - skip per-request access-log
+    # formatting. Long keepalive lets the front end reuse connections instead
+    # of re-handshaking, and the deeper backlog absorbs accept bursts.
+    web.run_app(
+        APP,
+        host="0.0.0.0",
+        port=PORT,
+        access_log=None,
+        keepalive_timeout=75,
+        backlog=2048,
+        reuse_port=(sys.platform != "win32"),
+    )